@@ -7,21 +7,36 @@ from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import FrozenSet
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import Mapping
 from typing import Optional
 from typing import Tuple
 from typing import Union
 from typing import get_type_hints
 
+import sys
 from dataclasses import dataclass
-from functools import partial
+from dataclasses import fields
 from functools import wraps
+from types import MappingProxyType
+from weakref import WeakKeyDictionary
 
 __all__ = ["overload", "override", "func_versions_info"]
 
 
 # Used when `Function`arguments are empty
 EMPTY_DICT = {"None": None}
+EMPTY_TYPE_HINTS = (tuple(EMPTY_DICT), tuple(EMPTY_DICT.values()))
+
+# Type hints (without return annotation) of the functions seen so far
+_TYPE_HINTS_CACHE: "WeakKeyDictionary[Callable[..., Any], Dict[str, Any]]" = (
+    WeakKeyDictionary()
+)
+
+# Output of `func_versions_info` per meta, invalidated when a version is stored
+_VERSIONS_INFO_CACHE: Dict[Tuple[str, str, str], str] = dict()
 
 
 ArgsType = Optional[Union[Any, List[Any]]]
@@ -47,10 +62,82 @@ class NamespaceKeyBase:
         name (str): The __name__ of the overloaded function.
     """
 
+    __slots__ = ("module", "qualname", "name", "_meta", "_hash", "_str_cache")
+
     module: str
     qualname: str
     name: str
 
+    def __post_init__(self) -> None:
+        """Interns the meta of the key and caches it.
+
+        Keys are compared and hashed whenever they are looked up in the namespace,
+        interned strings make this cheaper. Only strings are interned, as e.g. the
+        __module__ of a function created by `exec` may be None.
+        """
+        module, qualname, name = (
+            sys.intern(value) if isinstance(value, str) else value
+            for value in (self.module, self.qualname, self.name)
+        )
+        object.__setattr__(self, "module", module)
+        object.__setattr__(self, "qualname", qualname)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "_meta", (module, qualname, name))
+
+    def __hash__(self) -> int:
+        """Returns the hash of the key. Computed on first use and cached.
+
+        Returns:
+            int: The hash of the key.
+        """
+        try:
+            return self._hash  # type: ignore[attr-defined,no-any-return]
+        except AttributeError:
+            pass
+        value = hash(self._hashed_fields())
+        object.__setattr__(self, "_hash", value)
+        return value
+
+    def _hashed_fields(self) -> Tuple[Any, ...]:
+        """Private helper function for creating __hash__.
+
+        Returns:
+            Tuple[Any, ...]: The fields the hash of the key is computed from.
+        """
+        return self.meta
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Any, ...]]:
+        """Rebuilds the key through its constructor when copied or pickled.
+
+        The slots of a frozen key cannot be restored by assignment, and the
+        cached hash must not be carried over to another interpreter, as the
+        hashes of strings differ between interpreters.
+
+        Returns:
+            Tuple[Any, Tuple[Any, ...]]: The class and the fields of the key.
+        """
+        return (type(self), tuple(getattr(self, f.name) for f in fields(self)))
+
+    def _cached_str(self, build: Callable[[], str]) -> str:
+        """Private helper function for creating __str__.
+
+        Keys are frozen, hence their string representation is built only once
+        and cached on the key.
+
+        Args:
+            build (Callable[[], str]): Builds the string representation.
+
+        Returns:
+            str: The string representation of the key.
+        """
+        try:
+            return self._str_cache  # type: ignore[attr-defined,no-any-return]
+        except AttributeError:
+            pass
+        msg = build()
+        object.__setattr__(self, "_str_cache", msg)
+        return msg
+
     def _str_for_type_hint_dict(self, type_hints: Dict[str, Union[type, None]]) -> str:
         """Private helper function for creating __str__.
 
@@ -111,7 +198,7 @@ class NamespaceKeyBase:
         Returns:
             Tuple[str, str, str]: The meta of the key: (module, qualname, name)
         """
-        return (self.module, self.qualname, self.name)
+        return self._meta  # type: ignore[attr-defined,no-any-return]
 
 
 @dataclass(frozen=True)
@@ -137,8 +224,21 @@ class UnorderedNamespaceKey(NamespaceKeyBase):
             second giving the the types of the args.
     """
 
+    __slots__ = ("type_hints",)
+
     type_hints: FrozenSet[Any]
 
+    # keep the cached hash instead of the one generated by `dataclass`
+    __hash__ = NamespaceKeyBase.__hash__
+
+    def _hashed_fields(self) -> Tuple[Any, ...]:
+        """Private helper function for creating __hash__.
+
+        Returns:
+            Tuple[Any, ...]: The fields the hash of the key is computed from.
+        """
+        return (self.meta, self.type_hints)
+
     @property
     def unordered(self) -> "UnorderedNamespaceKey":
         """Returns the NamespaceKey with "unordered" type hints, thus `self`.
@@ -184,7 +284,7 @@ class UnorderedNamespaceKey(NamespaceKeyBase):
                      def func(var: int, var_2: str):
                          ..."
         """
-        return self._str_unordered()
+        return self._cached_str(self._str_unordered)
 
 
 @dataclass(frozen=True)
@@ -208,11 +308,24 @@ class NamespaceKey(NamespaceKeyBase):
             the second giving the the types of the args.
     """
 
+    __slots__ = ("type_hints", "_unordered")
+
     module: str
     qualname: str
     name: str
     type_hints: NspKeyTypeHints
 
+    # keep the cached hash instead of the one generated by `dataclass`
+    __hash__ = NamespaceKeyBase.__hash__
+
+    def _hashed_fields(self) -> Tuple[Any, ...]:
+        """Private helper function for creating __hash__.
+
+        Returns:
+            Tuple[Any, ...]: The fields the hash of the key is computed from.
+        """
+        return (self.meta, self.type_hints)
+
     @property
     def unordered(self) -> UnorderedNamespaceKey:
         """Returns the NamespaceKey with "unordered" type hints.
@@ -222,22 +335,28 @@ class NamespaceKey(NamespaceKeyBase):
         the stored key in a different order. For these cases we have to create a
         frozen set of the tuple represting the type hints.
 
+        The unordered key is computed on first access and cached on the key.
+
         Returns:
             UnorderedNamespaceKey: The NamespaceKey `self`, but with the type hints
                 stored as a frozen set.
         """
+        try:
+            return self._unordered  # type: ignore[attr-defined,no-any-return]
+        except AttributeError:
+            pass
         if not isinstance(self.type_hints[0], tuple):  # pragma: no cover
             type_hints = frozenset(self.type_hints)
         else:
-            type_hints = frozenset(
-                dict(zip(self.type_hints[0], self.type_hints[1])).items()
-            )
-        return UnorderedNamespaceKey(
+            type_hints = frozenset(zip(self.type_hints[0], self.type_hints[1]))
+        unordered = UnorderedNamespaceKey(
             module=self.module,
             qualname=self.qualname,
             name=self.name,
             type_hints=type_hints,
         )
+        object.__setattr__(self, "_unordered", unordered)
+        return unordered
 
     #########################################################
     #     FUNCTIONS FOR __STR__ REPRESENTATION (NamespaceKey)
@@ -274,7 +393,7 @@ class NamespaceKey(NamespaceKeyBase):
                      def func(var: int, var_2: str):
                          ..."
         """
-        return self._str_ordered()
+        return self._cached_str(self._str_ordered)
 
     ############################################################
     #  END OF FUNCTIONS FOR __STR__ REPRESENTATION (NamespaceKey)
@@ -291,7 +410,8 @@ def _overload_func_wrap(f: Callable[..., Any]) -> Callable[..., Any]:
 
     Required as a function is only turned into a method, after
     the metaclass to the class was create.
-    Used in `Function.__call__` for example.
+    `Function.__call__` inlines the same logic to avoid creating a
+    wrapper on every call.
 
     Args:
         f (Callable): The function we to wrap.
@@ -340,9 +460,141 @@ def _as_ordered_key(
         >>> hints = {"a": 1, "b": 2}
         >>> assert _as_ordered_key(hints) == (('a', 'b'), (1, 2))
     """
-    keys = tuple(key for key in dictionary.keys())
-    values = tuple(value for value in dictionary.values())
-    return (keys, values)
+    return (tuple(dictionary), tuple(dictionary.values()))
+
+
+def _unordered_signature(
+    names: Iterable[str], types: Iterable[Any]
+) -> FrozenSet[Tuple[str, Any]]:
+    """Returns the argument names and types as an unordered set of pairs.
+
+    Used to compare the keyword-arguments of a call with the type hints of a function
+    without caring for the order of the arguments.
+
+    Args:
+        names (Iterable[str]): The names of the arguments.
+        types (Iterable[Any]): The types of the arguments.
+
+    Returns:
+        FrozenSet[Tuple[str, Any]]: The (name, type) pairs.
+
+    Example:
+        >>> sig = _unordered_signature(("b", "a"), (int, str))
+        >>> assert sig == frozenset({("a", str), ("b", int)})
+    """
+    return frozenset(zip(names, types))
+
+
+def _type_hints(func: Callable[..., Any]) -> Dict[str, Any]:
+    """Returns the type hints of `func` without its return annotation.
+
+    `get_type_hints` is expensive, as it resolves string annotations. Thus, the
+    result is cached for every function that can be weakly referenced. The
+    returned dictionary must not be modified.
+
+    Args:
+        func (Callable): The function whose type hints are requested.
+
+    Returns:
+        Dict[str, Any]: The type hints of the arguments of `func`.
+    """
+    try:
+        return _TYPE_HINTS_CACHE[func]
+    except (KeyError, TypeError):
+        pass
+    hints = {
+        key: value for key, value in get_type_hints(func).items() if key != "return"
+    }
+    try:
+        _TYPE_HINTS_CACHE[func] = hints
+    except TypeError:  # pragma: no cover
+        pass  # `func` cannot be weakly referenced
+    return hints
+
+
+def _definition_key(func: Callable[..., Any]) -> NamespaceKey:
+    """Returns the key of `func` built from its type hints.
+
+    This is the key a function is stored with in the virtual namespace. It
+    requires `get_type_hints`, which is expensive, and should therefore only be
+    computed once per function, i.e. when the function gets registered.
+
+    Args:
+        func (Callable): The function we want to generate a key for.
+
+    Returns:
+        NamespaceKey: The NamespaceKey for the function.
+    """
+    hints = _type_hints(func) or EMPTY_DICT
+    return NamespaceKey(
+        module=func.__module__,
+        qualname=func.__qualname__,
+        name=func.__name__,
+        type_hints=_as_ordered_key(hints),
+    )
+
+
+def _call_key_from_args(
+    func: Callable[..., Any], args: Tuple[Any, ...]
+) -> NamespaceKey:
+    """Returns the key for a call of `func` using only positional arguments.
+
+    Args:
+        func (Callable): The called function.
+        args (Tuple[Any, ...]): The args given to the function.
+
+    Returns:
+        NamespaceKey: The NamespaceKey for the call.
+    """
+    hints = tuple(map(type, args))
+    return NamespaceKey(
+        module=func.__module__,
+        qualname=func.__qualname__,
+        name=func.__name__,
+        type_hints=hints or EMPTY_TYPE_HINTS,
+    )
+
+
+def _call_key_from_kwargs(
+    func: Callable[..., Any], kwargs: Dict[str, Any]
+) -> NamespaceKey:
+    """Returns the key for a call of `func` using keyword-arguments.
+
+    Args:
+        func (Callable): The called function.
+        kwargs (Dict[str, Any]): The keyword-arguments given to the function.
+
+    Returns:
+        NamespaceKey: The NamespaceKey for the call.
+    """
+    return NamespaceKey(
+        module=func.__module__,
+        qualname=func.__qualname__,
+        name=func.__name__,
+        type_hints=(tuple(kwargs), tuple(map(type, kwargs.values()))),
+    )
+
+
+def _call_key(
+    func: Callable[..., Any], args: Tuple[Any, ...], kwargs: KwargsType = None
+) -> NamespaceKey:
+    """Returns the key for a call of `func`.
+
+    Only uses the types of the given arguments and never the type hints of
+    `func`, which keeps `get_type_hints` off the path of a call.
+
+    Args:
+        func (Callable): The called function.
+        args (Tuple[Any, ...]): The args given to the function.
+        kwargs (KwargsType): The keyword-arguments given to the function.
+            Defaults to None.
+
+    Returns:
+        NamespaceKey: The NamespaceKey for the call.
+    """
+    if kwargs:
+        return _call_key_from_kwargs(func, kwargs)
+    return _call_key_from_args(func, args)
 
 
 def _generate_key(
@@ -350,6 +602,10 @@ def _generate_key(
 ) -> NamespaceKey:
     """Returns the key that will uniquely identify a function.
 
+    If `args` is None, the key is generated from the type hints of `func`.
+    Otherwise, the key is generated from the types of the given `kwargs` or,
+    if no `kwargs` are given, from the types of the given `args`.
+
     Args:
         func (Callable): The function we want to generate a key for.
         args (ArgsType): The args given to the function. Defaults to None.
@@ -359,30 +615,9 @@ def _generate_key(
     Returns:
         NamespaceKey: The NamespaceKey for the function,
     """
-    arg_dict = dict()
-    if kwargs is None:
-        kwargs = dict()
     if args is None:
-        hints = {
-            key: value for key, value in get_type_hints(func).items() if key != "return"
-        }
-        hints = hints or EMPTY_DICT
-        type_hints = _as_ordered_key(hints)
-    else:
-        if kwargs != {}:
-            for key, value in kwargs.items():
-                arg_dict[key] = type(value)
-            type_hints = _as_ordered_key(arg_dict)
-        else:
-            hints = tuple(type(args[i]) for i in range(len(args)))  # type: ignore # noqa: B950
-            type_hints = hints or _as_ordered_key(EMPTY_DICT)  # type: ignore
-    result = NamespaceKey(
-        module=func.__module__,
-        qualname=func.__qualname__,
-        name=func.__name__,
-        type_hints=type_hints,
-    )
-    return result
+        return _definition_key(func)
+    return _call_key(func, args, kwargs)  # type: ignore[arg-type]
 
 
 ######################################
@@ -405,7 +640,7 @@ class NoFunctionFoundError(PyOverloadError):
         self.func_key = func_key
         self.message = message
         if func_key is not None:  # pragma: no cover
-            options = Namespace.get_instance().keys_matching_func_name(func_key)
+            options = _NAMESPACE.keys_matching_func_name(func_key)
             self.message += f"Following definitions of '{func_key.name}' were found:\n"
             self.message += "\n".join([key.__str__() for key in options])
             self.message += f"\nThe following call was made:\n{func_key}"
@@ -417,34 +652,50 @@ class NoFunctionFoundError(PyOverloadError):
 ######################################
 
 
-class Function(partial):  # type: ignore
+class Function:
     """Class wrapping a callable.
 
-    Subclass of functools.partial.
-
     Args:
-        func (Callable): The function we want to wrap. (c.f. functools.partial)
-        args (ArgsTape): Optional arguments. (c.f. functools.partial)
-        keywords (KwargsType): Optional keywords. (c.f. functools.partial)
+        func (Callable): The function we want to wrap.
     """
 
-    def __init__(
-        self, func: Callable[..., Any], *args: ArgsType, **keywords: KwargsType
-    ) -> None:
+    __slots__ = (
+        "func",
+        "owner",
+        "__qualname__",
+        "_def_key",
+        "_types_table",
+        "_kwargs_table",
+        "__weakref__",
+    )
+
+    def __init__(self, func: Callable[..., Any]) -> None:
         """__init__ methode of `Function`.
 
-        Sets the __qualname__ to wrapped functions __qualname__ initiates
-        the owner of the function as None (required if function is a method)
-        and calls super().__init__().
+        Stores the wrapped function, sets the __qualname__ to wrapped functions
+        __qualname__ and initiates the owner of the function as None (required
+        if function is a method). The key of the wrapped function is computed
+        once and cached, as it requires `get_type_hints`. So are the dispatch
+        tables of the function, which the namespace updates whenever a version
+        of the function is added.
 
         Args:
             func (Callable[..., Any]): The function to be wrapped.
-            *args (ArgsType): Additional optional args.
-            **keywords (KwargsType): Additional optional kwargs.
         """
-        super().__init__()  # type: ignore
+        self.func = func
         self.owner = None  # type: Optional[Union[Any, "Function"]]
-        self.__qualname__ = self.func.__qualname__
+        self.__qualname__ = func.__qualname__
+        self._def_key = _definition_key(func)
+        self._types_table = _NAMESPACE.types_table(self._def_key.meta)
+        self._kwargs_table = _NAMESPACE.kwargs_table(self._def_key.meta)
+
+    def __repr__(self) -> str:
+        """Representation of `Function`, showing the wrapped function.
+
+        Returns:
+            str: The representation, e.g. "Function(<function func at 0x...>)".
+        """
+        return f"{type(self).__name__}({self.func!r})"
 
     def __get__(self, owner: Any, owner_type: Optional[type] = None) -> "Function":
         """__get__-dunder method of Function.
@@ -469,7 +720,7 @@ class Function(partial):  # type: ignore
             fn (Callable[..., Any]): A callable, whose call we want to add to
                 calls of `self`.
         """
-        Namespace.get_instance().add(self.func, fn)
+        _NAMESPACE.add(self.func, fn)
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         """Overriding the __call__ function which makes the instance callable.
@@ -484,21 +735,33 @@ class Function(partial):  # type: ignore
         Returns:
             Any: The value of the function.
         """
-        # fetching the function to be invoked from the virtual namespace
-        # through the arguments.
-        fn = Namespace.get_instance().get(self.func, *args, **kwargs)
+        # fetching the function to be invoked from the dispatch tables of this
+        # function through the arguments. Only if no version matches, the virtual
+        # namespace is asked, which raises an error on wrong types of kwargs.
+        if kwargs:
+            signature = _unordered_signature(kwargs, map(type, kwargs.values()))
+            fn = self._kwargs_table.get(signature)
+            if fn is None:
+                fn = _NAMESPACE.get(self.func, *args, **kwargs)
+        else:
+            fn = self._types_table.get(tuple(map(type, args)))
         if fn is None:
             raise NoFunctionFoundError(self.key(args, kwargs))
 
-        # invoking the wrapped function and returning the value.
-        func = _overload_func_wrap(fn)
-        return func(self.owner, *args, **kwargs)
+        # invoking the wrapped function and returning the value, inserting the
+        # owner if the function is a method (c.f. `_overload_func_wrap`).
+        if self.owner is None:
+            return fn(*args, **kwargs)
+        return fn(self.owner, *args, **kwargs)
 
     def key(
         self, args: Optional[Any] = None, kwargs: Optional[Any] = None
     ) -> NamespaceKey:
         """Returns the key that will uniquely identify a function.
 
+        Without `args`, this is the cached key of the wrapped function, otherwise
+        the key of a call with the given `args` and `kwargs`.
+
         Args:
             args (Any, optional): The args given to the function. Defaults to None.
             kwargs (Any, optional): The keyword-arguments given to the function.
@@ -507,7 +770,9 @@ class Function(partial):  # type: ignore
         Returns:
             NamespaceKey: The NamespaceKey for the function,
         """
-        return _generate_key(self.func, args, kwargs)
+        if args is None:
+            return self._def_key
+        return _call_key(self.func, args, kwargs)
 
     @property
     def __wrapped__(self) -> Callable[..., Any]:
@@ -529,6 +794,8 @@ class Function(partial):  # type: ignore
 class Namespace(object):
     """Singleton class that is responsible for holding all the functions."""
 
+    __slots__ = ("_per_meta", "_by_types", "_by_kwnames", "_by_argnames")
+
     __instance: Optional["Namespace"] = None
 
     def __init__(self) -> None:
@@ -538,13 +805,46 @@ class Namespace(object):
             Exception: If a instance of Namespace already exists.
         """
         if self.__instance is None:
-            self.function_map: Dict[NamespaceKey, Callable[..., Any]] = dict()
+            # The stored functions grouped by the meta (module, qualname, name)
+            # of their keys, together with the dispatch tables per meta. The
+            # tables are kept in sync by `_index` and used for dispatching a call.
+            self._per_meta: Dict[
+                Tuple[str, str, str], Dict[NamespaceKey, Callable[..., Any]]
+            ] = dict()
+            self._by_types: Dict[
+                Tuple[str, str, str], Dict[Tuple[Any, ...], Callable[..., Any]]
+            ] = dict()
+            self._by_kwnames: Dict[
+                Tuple[str, str, str],
+                Dict[FrozenSet[Tuple[str, Any]], Callable[..., Any]],
+            ] = dict()
+            self._by_argnames: Dict[
+                Tuple[str, str, str], Dict[Tuple[str, ...], List[NamespaceKey]]
+            ] = dict()
             Namespace.__instance = self
         else:
             raise Exception(
                 "Cannot instantiate a virtual Namespace again"
             )  # pragma: no cover
 
+    @property
+    def function_map(self) -> Mapping[NamespaceKey, Callable[..., Any]]:
+        """All functions stored in the namespace by their keys.
+
+        The map is built on access and read-only, changing it raises a TypeError.
+        Use `register` or `add` instead.
+
+        Returns:
+            Mapping[NamespaceKey, Callable[..., Any]]: The stored functions.
+        """
+        return MappingProxyType(
+            {
+                key: fn
+                for functions in self._per_meta.values()
+                for key, fn in functions.items()
+            }
+        )
+
     @staticmethod
     def get_instance() -> "Namespace":
         """Returns an instance of `Namespace`, if no other exists.
@@ -570,9 +870,97 @@ class Namespace(object):
             Function: The wrapped function `Function(fn)`.
         """
         func = Function(fn)
-        self.function_map[func.key()] = fn
+        self._insert(func.key(), fn)
         return func
 
+    def _insert(self, key: NamespaceKey, fn: Callable[..., Any]) -> None:
+        """Stores `fn` under `key` in the virtual namespace.
+
+        Args:
+            key (NamespaceKey): The key of the function.
+            fn (Callable[..., Any]): The function to be stored.
+        """
+        functions = self._per_meta.setdefault(key.meta, {})
+        stored = key in functions
+        functions[key] = fn
+        if stored:
+            # the key keeps its position, which decides ambiguous calls
+            self._index(key.meta)
+        else:
+            self._index_key(key, fn)
+
+    def types_table(
+        self, meta: Tuple[str, str, str]
+    ) -> Dict[Tuple[Any, ...], Callable[..., Any]]:
+        """Returns the positional dispatch table of the functions with `meta`.
+
+        The table maps the types of positional arguments to the matching version
+        of the function. It is updated in place, whenever a version is stored in
+        the namespace, and may therefore be kept by `Function`.
+
+        Args:
+            meta (Tuple[str, str, str]): The meta of the function.
+
+        Returns:
+            Dict[Tuple[Any, ...], Callable[..., Any]]: The dispatch table.
+        """
+        return self._by_types.setdefault(meta, {})
+
+    def kwargs_table(
+        self, meta: Tuple[str, str, str]
+    ) -> Dict[FrozenSet[Tuple[str, Any]], Callable[..., Any]]:
+        """Returns the keyword-argument dispatch table of the functions with `meta`.
+
+        The table maps the unordered (name, type) pairs of keyword-arguments
+        (c.f. `_unordered_signature`) to the matching version of the function. Like
+        `types_table`, it is updated in place.
+
+        Args:
+            meta (Tuple[str, str, str]): The meta of the function.
+
+        Returns:
+            Dict[FrozenSet[Tuple[str, Any]], Callable[..., Any]]: The dispatch
+                table.
+        """
+        return self._by_kwnames.setdefault(meta, {})
+
+    def _index_key(self, key: NamespaceKey, fn: Callable[..., Any]) -> None:
+        """Adds the function `fn` stored under `key` to the dispatch tables.
+
+        The tables map the types of the arguments (positional calls) and the
+        unordered argument names and types (calls using kwargs) directly to the
+        stored function, such that a call only requires a single lookup. If
+        several keys match a call, positional calls resolve to the first stored
+        key and calls using kwargs to the last one. Additionally, the keys are
+        grouped by their argument names, which is used for error messages.
+
+        Args:
+            key (NamespaceKey): The key of the function.
+            fn (Callable[..., Any]): The stored function.
+        """
+        names, types = key.type_hints
+        # functions without arguments are called without any types
+        self.types_table(key.meta).setdefault(
+            () if key.type_hints == EMPTY_TYPE_HINTS else types, fn
+        )
+        self.kwargs_table(key.meta)[_unordered_signature(names, types)] = fn
+        self._by_argnames.setdefault(key.meta, {}).setdefault(names, []).append(key)
+        _VERSIONS_INFO_CACHE.pop(key.meta, None)
+
+    def _index(self, meta: Tuple[str, str, str]) -> None:
+        """Rebuilds the dispatch tables for the functions with meta `meta`.
+
+        Required, if a function is stored under an existing key (c.f. `_index_key`).
+
+        Args:
+            meta (Tuple[str, str, str]): The meta of the keys to be indexed.
+        """
+        self.types_table(meta).clear()
+        self.kwargs_table(meta).clear()
+        self._by_argnames[meta] = dict()
+        for key, fn in self._per_meta[meta].items():
+            self._index_key(key, fn)
+
     def add(
         self,
         parent_fn: Callable[..., Any],
@@ -594,13 +982,8 @@ class Namespace(object):
             type_hints_list = [
                 func_key.type_hints for func_key in get_overloads(child_fn)
             ]
-        elif isinstance(child_fn, Callable):  # type: ignore[arg-type]
-            hints = {
-                key: value
-                for key, value in get_type_hints(child_fn).items()
-                if key != "return"
-            }
-            type_hints_list = [_as_ordered_key(hints)]
+        elif callable(child_fn):
+            type_hints_list = [_as_ordered_key(_type_hints(child_fn))]
         else:  # pragma: no cover
             raise (
                 ValueError(
@@ -614,20 +997,20 @@ class Namespace(object):
                 name=parent_fn.__name__,
                 type_hints=type_hints,
             )
-            self.function_map[key] = child_fn
+            self._insert(key, child_fn)
 
     def get(
         self, fn: Callable[..., Any], *args: Any, **kwargs: Any
     ) -> Optional[Callable[..., Any]]:
         """Returns the matching function.
 
-        Tries to find the desired function for given args and kwargs using several
-        approaches. At first, it compares only the types of the given arguments with the
-        type patterns for the several overloaded version of the function `fn`. If no
-        key, is matching the type pattern of the arguments, it raises an TypeError and
-        prints the wrong types. If no exception occurred, it assumes that the arguments
-        were given as keyword-arguments and checks again without caring for the
-        postition of the arguments.
+        Tries to find the desired function for given args and kwargs. If no kwargs
+        are given, it compares only the types of the given arguments with the type
+        patterns for the several overloaded version of the function `fn`. Otherwise,
+        it compares the names and types of the keyword-arguments without caring for
+        their position. If no version matches, but some have the same argument
+        names as the keyword-arguments, it raises an TypeError and prints the wrong
+        types.
 
         Args:
             fn (Callable): The overloaded function.
@@ -643,36 +1026,35 @@ class Namespace(object):
             PyOverloadError: If the arguments have the correct keywords,
                 but wrong variable types.
         """
-        func = Function(fn)
-        func_key = func.key(args=args, kwargs=kwargs)
-
-        # Check if given argument types fit one of the namespace key argument types
-        valid_key = self.match_only_by_type(func_key=func_key)
-        similar_keys = self.func_arg_names_matchin_kwargs_keys(func_key)
-        result = self.function_map.get(func_key) or valid_key
-
-        # func_key is not in namespace and argument types fo not fit to any namespace
-        # key -> raise(ValueError)
-        if result is None and similar_keys != []:
-            excinfo = f"\nError when calling:\n{func_key}:"
-            excinfo += "".join(self.difference(similar_keys, func_key))
-            raise (PyOverloadError(excinfo))
-
-        return self.match_by_kwargs(func_key=func_key) or self.match_only_by_type(
-            func_key=func_key
-        )
+        meta = (fn.__module__, fn.__qualname__, fn.__name__)
+        if not kwargs:
+            # most common case: a single lookup using the types of the args
+            return self._by_types.get(meta, {}).get(tuple(map(type, args)))
+
+        signature = _unordered_signature(kwargs, map(type, kwargs.values()))
+        result = self._by_kwnames.get(meta, {}).get(signature)
+        if result is None:
+            func_key = _call_key_from_kwargs(fn, kwargs)
+            # argument types do not fit to any namespace key, but some namespace
+            # keys have the given argument names -> raise(PyOverloadError)
+            similar_keys = self.func_arg_names_matchin_kwargs_keys(func_key)
+            if similar_keys:
+                excinfo = f"\nError when calling:\n{func_key}:"
+                excinfo += "".join(self.difference(similar_keys, func_key))
+                raise (PyOverloadError(excinfo))
+        return result
 
     def difference(
         self, val_keys: List[NamespaceKey], my_key: NamespaceKey
-    ) -> List[str]:
-        """Returns the typing information to `similar_keys` (c.f. `get`).
+    ) -> Iterator[str]:
+        """Yields the typing information to `similar_keys` (c.f. `get`).
 
         Args:
             val_keys (List[NamespaceKey]): The `similar_keys`.
             my_key (NamespaceKey): The compared key.
 
-        Returns:
-            List[str]: List containing the typing information.
+        Yields:
+            str: The typing information for one argument.
 
         Raises:
             TypeError: if one of the NamespaceKeys in `val_keys` is
@@ -680,17 +1062,15 @@ class Namespace(object):
         """
         if not isinstance(my_key.type_hints, frozenset):  # pragma: no cover
             my_key_dict = dict(zip(my_key.type_hints[0], my_key.type_hints[-1]))
-        results = []
         for val_key in val_keys:
             if not isinstance(val_key.type_hints, frozenset):
                 keys = val_key.type_hints[0]
                 values = val_key.type_hints[-1]
-                result = [
-                    f"\n\t'{key}' needs to be of type {values} (is type"
-                    f" {my_key_dict[key]})"
-                    for key, value in zip(keys, values)
-                ]
-                results += result
+                for key in keys:
+                    yield (
+                        f"\n\t'{key}' needs to be of type {values} (is type"
+                        f" {my_key_dict[key]})"
+                    )
             else:
                 raise (
                     TypeError(
@@ -698,8 +1078,6 @@ class Namespace(object):
                     )
                 )  # pragma: no cover
 
-        return results
-
     def keys_matching_func_name(self, func_key: NamespaceKey) -> List[NamespaceKey]:
         """Returns the keys that match the functionname, -module and -class.
 
@@ -709,14 +1087,14 @@ class Namespace(object):
         Returns:
             List[NamespaceKey]: The matching NamespaceKeys
         """
-        return [key for key in self.function_map.keys() if key.meta == func_key.meta]
+        return list(self._per_meta.get(func_key.meta, {}))
 
     def match_only_by_type(
         self, func_key: NamespaceKey
     ) -> Optional[Callable[..., Any]]:
         """Returns the wrapped function, if a type-match was found.
 
-        Compares only the namespace keys, given by `keys_matching_func_name`. A
+        Compares only the namespace keys with the same meta as `func_key`. A
         type-match is found, if the types of the given function arguments match to the
         types of one of the Namespace keys.
 
@@ -727,12 +1105,10 @@ class Namespace(object):
             Optional[Function]: The wrapped function,
                 if a type-match was found, None otherwise.
         """
-        opt_keys = self.keys_matching_func_name(func_key=func_key)
-        for key in opt_keys:
-            args = key.type_hints[-1]
-            if func_key.type_hints == args:
-                return self.function_map.get(key)
-        return None
+        type_hints = func_key.type_hints
+        if type_hints == EMPTY_TYPE_HINTS:
+            type_hints = ()
+        return self._by_types.get(func_key.meta, {}).get(type_hints)
 
     def match_by_kwargs(self, func_key: NamespaceKey) -> Optional[Callable[..., Any]]:
         """Returns the wrapped function using the keyword arguments of the function.
@@ -746,10 +1122,12 @@ class Namespace(object):
             Optional[Function]: The wrapped function, if a match was found,
                 None otherwise.
         """
-        copy = tuple(key.unordered for key in self.function_map.keys())
-        key_dict = dict(zip(copy, self.function_map.keys()))
-        match = key_dict.get(func_key.unordered)
-        return self.function_map.get(match)  # type: ignore
+        if not isinstance(func_key.type_hints[0], tuple):
+            return None
+        names, types = func_key.type_hints
+        return self._by_kwnames.get(func_key.meta, {}).get(
+            _unordered_signature(names, types)
+        )
 
     def func_arg_names_matchin_kwargs_keys(
         self, func_key: NamespaceKey
@@ -762,8 +1140,13 @@ class Namespace(object):
         Returns:
             List[NamespaceKey]: The matching keys in the virtual namespace.
         """
-        opt_keys = self.keys_matching_func_name(func_key=func_key)
-        return [key for key in opt_keys if func_key.type_hints[0] == key.type_hints[0]]
+        by_argnames = self._by_argnames.get(func_key.meta, {})
+        return list(by_argnames.get(func_key.type_hints[0], []))
+
+
+# The (singleton) virtual namespace. Referenced directly on every call of an
+# overloaded function instead of going through `Namespace.get_instance`.
+_NAMESPACE = Namespace.get_instance()
 
 
 ##############################################
@@ -795,7 +1178,7 @@ def overload(fn: Callable[..., Any]) -> Function:
         >>> "a: " + func(1)
         "a: 5"
     """
-    return Namespace.get_instance().register(fn)
+    return _NAMESPACE.register(fn)
 
 
 def override(
@@ -832,7 +1215,7 @@ def override(
 
     def wrapper(new_func: Callable[..., Any]) -> Function:
         for func in funcs:
-            Namespace.get_instance().add(new_func, func)
+            _NAMESPACE.add(new_func, func)
         return overload(new_func)
 
     return wrapper
@@ -867,8 +1250,7 @@ def get_overloads(func: Function) -> List[NamespaceKey]:
                 pass
         >>> assert _generate_key(other_func.__wrapped__) not in get_overload(func)
     """
-    func_key = _generate_key(func.__wrapped__)
-    return Namespace.get_instance().keys_matching_func_name(func_key)
+    return _NAMESPACE.keys_matching_func_name(func.key())
 
 
 def func_versions_info(func: Function) -> str:
@@ -901,6 +1283,12 @@ def func_versions_info(func: Function) -> str:
             def func(var: int):
                 ...
     """
+    meta = func.key().meta
+    try:
+        return _VERSIONS_INFO_CACHE[meta]
+    except KeyError:
+        pass
     msg = f"Following overloads of '{func.__qualname__}' exist:\n"
     msg += "\n".join([key.__str__() for key in get_overloads(func)])
+    _VERSIONS_INFO_CACHE[meta] = msg
     return msg
@@ -10,14 +10,21 @@ from typing import Tuple
 from typing import Union
 from typing import get_type_hints
 
+import copy
+import inspect
+import pickle  # noqa: S403
+import weakref
 from dataclasses import dataclass
 
 import pytest
 
 from overloadlib.overloadlib import Function
+from overloadlib.overloadlib import Namespace
 from overloadlib.overloadlib import NamespaceKey
+from overloadlib.overloadlib import NamespaceKeyBase
 from overloadlib.overloadlib import NoFunctionFoundError
 from overloadlib.overloadlib import _generate_key
+from overloadlib.overloadlib import _overload_func_wrap
 from overloadlib.overloadlib import func_versions_info
 from overloadlib.overloadlib import overload
 from overloadlib.overloadlib import override
@@ -82,6 +89,17 @@ def test_function_init(some_func: Callable[..., Any]) -> None:
     )
     assert expected == func.key()
     assert _generate_key(some_func) == func.key()
+    call_key = NamespaceKey(
+        some_func.__module__, some_func.__qualname__, some_func.__name__, (str, int)
+    )
+    assert _generate_key(some_func, ("a", 1)) == func.key(("a", 1)) == call_key
+    kwargs = {"int_1": 1}
+    assert _generate_key(some_func, (), kwargs) == func.key((), kwargs)
+    assert func.key((), kwargs).type_hints == (("int_1",), (int,))
+    assert func.__wrapped__ is some_func
+    assert repr(func) == f"Function({some_func!r})"
+    assert weakref.ref(func)() is func
+    assert inspect.signature(func) == inspect.signature(some_func)
 
 
 def test_overload() -> None:
@@ -134,6 +152,40 @@ def test_overload() -> None:
     assert some_func() == "I am empty"
 
 
+def test_overload_same_signature() -> None:
+    """Overloading a version with the same signature again replaces it."""
+
+    @overload
+    def some_func(int_1: int) -> str:
+        return "first"
+
+    @overload  # type: ignore
+    def some_func(int_1: int) -> str:  # noqa: F811
+        return "second"
+
+    assert some_func(1) == "second"
+    assert some_func(int_1=1) == "second"
+
+
+def test_overload_without_module() -> None:
+    """Functions without a module, e.g. created by `exec`, can be overloaded."""
+    scope: Dict[str, Any] = {"overload": overload}
+    source = "@overload\ndef func(int_1: int) -> int:\n    return int_1"
+    exec(source, scope)  # noqa: S102
+    assert scope["func"].key().module is None
+    assert scope["func"](1) == 1
+
+
+def test_overload_func_wrap() -> None:
+    """The wrapped function is called with its owner, if there is one."""
+
+    def func(*args: Any) -> Tuple[Any, ...]:
+        return args
+
+    assert _overload_func_wrap(func)(None, 1) == (1,)
+    assert _overload_func_wrap(func)("owner", 1) == ("owner", 1)
+
+
 def test_overload_on_class_method() -> None:
     """Test overload of methods."""
 
@@ -187,18 +239,133 @@ def test_namespacekey() -> None:
     """Test string representation and other features of NamespaceKey."""
 
     @overload
-    def some_func(str_1: str, int_1: int):
+    def some_func(str_1: str, int_1: int) -> str:
         return str_1 + str(int_1)
 
     @overload  # type: ignore
-    def some_func(str_1: str):  # noqa: F811
+    def some_func(str_1: str) -> str:  # noqa: F811
         return str_1
 
     assert some_func.key().unordered.unordered == some_func.key().unordered
     assert "def some_func(str_1: str, int_1: int):" in func_versions_info(some_func)
+    assert "def some_func(int_1: int):" not in func_versions_info(some_func)
+
+    def int_version(int_1: int) -> int:
+        return int_1
+
+    some_func.add(int_version)
+    assert "def some_func(int_1: int):" in func_versions_info(some_func)
     assert str(some_func.key().unordered) == some_func.key().unordered._str_unordered()
 
 
+def test_namespacekey_hash() -> None:
+    """Keys are hashed on first use, including the base key without type hints."""
+    base = NamespaceKeyBase("m", "q", "n")
+    assert hash(base) == hash(NamespaceKeyBase("m", "q", "n"))
+    key = NamespaceKey("m", "q", "n", (("a",), (int,)))
+    assert hash(key) == hash(NamespaceKey("m", "q", "n", (("a",), (int,))))
+    assert hash(key.unordered) == hash(
+        NamespaceKey("m", "q", "n", (("a",), (int,))).unordered
+    )
+    unhashable = NamespaceKey("m", "q", "n", [int])  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        hash(unhashable)
+
+
+def test_namespacekey_copy_and_pickle() -> None:
+    """Copies and pickles of a NamespaceKey are equal keys with the same hash."""
+    key = NamespaceKey("m", "q", "n", (("a",), (int,)))
+    pickled = pickle.loads(pickle.dumps(key))  # noqa: S301
+    for other in (copy.copy(key), copy.deepcopy(key), pickled):
+        assert other == key
+        assert hash(other) == hash(key)
+        assert other.meta == key.meta
+    unordered = key.unordered
+    assert pickle.loads(pickle.dumps(unordered)) == unordered  # noqa: S301
+
+
+def test_no_function_found_error() -> None:
+    """The error lists the definitions that existed when it was raised."""
+
+    @overload
+    def some_func(str_1: str) -> str:
+        return str_1
+
+    with pytest.raises(NoFunctionFoundError) as excinfo:
+        some_func(1)
+    err = excinfo.value
+
+    @some_func.add
+    def _(int_1: int, str_1: str) -> str:
+        return str_1 * int_1
+
+    message = str(err)
+    assert message.startswith("No matching function found.")
+    assert "def some_func(str_1: str):" in message
+    assert "int_1" not in message
+    assert err.args == (message,)
+    assert err.message == message
+
+
+def test_namespace_get() -> None:
+    """Gets the versions of a function from the namespace."""
+
+    @overload
+    def some_func(str_1: str, int_1: int) -> str:
+        return str_1 + str(int_1)
+
+    namespace = Namespace.get_instance()
+    fn = some_func.func
+    assert namespace.get(fn, "a", 1) is fn
+    assert namespace.get(fn, 1) is None
+    assert namespace.get(fn, int_1=1, str_1="a") is fn
+    assert namespace.get(fn, int_1=1) is None
+    with pytest.raises(TypeError) as excinfo:
+        namespace.get(fn, str_1="a", int_1="1")
+    assert "'int_1' needs to be of type" in str(excinfo.value)
+
+
+def test_namespace_function_map() -> None:
+    """The function map is a view of the functions stored per meta."""
+
+    @overload
+    def some_func(str_1: str) -> str:
+        return str_1
+
+    namespace = Namespace.get_instance()
+    function_map = namespace.function_map
+    for meta, functions in namespace._per_meta.items():
+        for key, fn in functions.items():
+            assert key.meta == meta
+            assert function_map[key] is fn
+    assert len(function_map) == sum(map(len, namespace._per_meta.values()))
+    assert function_map[some_func.key()] is some_func.func
+    with pytest.raises(TypeError):
+        function_map[some_func.key()] = some_func  # type: ignore[index]
+
+
+def test_namespace_match() -> None:
+    """Matches the keys of calls with the versions stored in the namespace."""
+
+    @overload
+    def some_func(str_1: str, int_1: int) -> str:
+        return str_1 + str(int_1)
+
+    @some_func.add
+    def _() -> str:
+        return "I am empty"
+
+    namespace = Namespace.get_instance()
+    assert namespace.match_only_by_type(some_func.key(("a", 1))) is some_func.func
+    empty = namespace.match_only_by_type(some_func.key(()))
+    assert empty is not None and empty() == "I am empty"
+    assert namespace.match_only_by_type(some_func.key((1,))) is None
+    kwargs = {"int_1": 1, "str_1": "a"}
+    assert namespace.match_by_kwargs(some_func.key((), kwargs)) is some_func.func
+    assert namespace.match_by_kwargs(some_func.key((), {"int_1": 1})) is None
+    assert namespace.match_by_kwargs(some_func.key(("a", 1))) is None
+
+
 def test_override() -> None:
     """Overrides functions."""
 
@@ -245,9 +412,14 @@ def test_add() -> None:
     def _(str_1: str, str_2: str) -> str:
         return str_1 + str_2
 
+    @some_func.add  # type: ignore[no-redef]
+    def _() -> str:
+        return "I return some text."
+
     assert some_func("This is a number: ", 10) == "This is a number: 10"
     assert some_func("cheese") == "cheese"
     assert some_func(Some()) == "Hello"
+    assert some_func() == "I return some text."
     check_exceptions(some_func)
 
 